@@ -0,0 +1,112 @@
+"""Shared building blocks for the generate_map tools.
+
+Type lists, vectorized placement helpers and the streaming map.json writer
+live here so every map driver shares one (optimized) hot path. Helpers
+take a numpy.random.Generator so a whole map is driven by one seeded RNG.
+"""
+import json
+import math
+from collections import Counter
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback, slower on large item lists
+    orjson = None
+
+# Lists of types
+RHYTHM_TYPES = [
+    "kick_drum_geyser",
+    "snare_trap",
+    "cymbal_dandelion",
+    "subwoofer_lotus",
+    "accordion_palm"
+]
+
+MELODY_TYPES = [
+    "arpeggio_fern",
+    "vibrato_violet",
+    "tremolo_tulip",
+    "prism_rose_bush",
+    "portamento_pine"
+]
+
+SCATTER_TYPES = [
+    "bubble_willow",
+    "fiber_optic_willow",
+    "balloon_bush",
+    "helix_plant",
+    "wisteria_cluster",
+    "floating_orb",
+    "cloud"
+]
+
+FILLER_TYPES = [
+    "mushroom",
+    "flower",
+    "starflower"
+]
+
+SAFE_RADIUS = 20  # No major objects within this distance of spawn
+
+
+def scatter_uniform_disc(n, rmin, rmax, rng):
+    """Sample n points in the annulus [rmin, rmax]; returns (xs, zs) arrays."""
+    angles = rng.uniform(0, math.tau, n)
+    dists = rng.uniform(rmin, rmax, n)
+    return np.cos(angles) * dists, np.sin(angles) * dists
+
+
+def cluster_items(center, type_list, count, rng):
+    """Scatter count items of type_list within 8 units of center."""
+    cx, cz = center
+    rs = rng.uniform(0, 8, count)
+    thetas = rng.uniform(0, math.tau, count)
+    xs = cx + np.cos(thetas) * rs
+    zs = cz + np.sin(thetas) * rs
+    scales = rng.uniform(0.8, 1.2, count)
+    type_names = rng.choice(type_list, count)
+
+    # Check global safety (though 30 base + 8 radius > 20, let's be safe)
+    keep = xs*xs + zs*zs >= SAFE_RADIUS * SAFE_RADIUS
+
+    return [{
+        "type": type_name,
+        "position": [x, 0, z],
+        "scale": scale
+    } for x, z, scale, type_name in zip(xs[keep].tolist(), zs[keep].tolist(),
+                                        scales[keep].tolist(), type_names[keep].tolist())]
+
+
+def _dumps(item, pretty=False):
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(item, option=option)
+    if pretty:
+        return json.dumps(item, indent=2).encode("utf-8")
+    return json.dumps(item, separators=(',', ':')).encode("utf-8")
+
+
+def write_map_streaming(path, stages, pretty=False):
+    """Stream items from each stage (an iterable of dicts) into a JSON array.
+
+    Items are serialized one at a time, so peak memory does not grow with
+    the map size. Output is compact unless pretty is set. Returns a Counter
+    of item types for the summary.
+    """
+    type_counts = Counter()
+    item_sep = b',\n' if pretty else b','
+    with open(path, 'wb', buffering=1 << 20) as f:
+        f.write(b'[\n' if pretty else b'[')
+        sep = b''
+        for stage in stages:
+            for item in stage:
+                f.write(sep)
+                f.write(_dumps(item, pretty))
+                sep = item_sep
+                type_counts[item["type"]] += 1
+        f.write(b'\n]' if pretty else b']')
+    return type_counts
@@ -0,0 +1,174 @@
+"""Bridson Poisson-disc sampling for map placement.
+
+Produces blue-noise points (no two closer than `radius`) in O(n): a
+background grid with cell diagonal == radius holds at most one point per
+cell, so each candidate only checks its 5x5 cell neighbourhood.
+Mirrors tools/map-generator/poisson-disc-sampler.ts.
+
+With numba installed (tools/requirements-optional.txt) the sampling loop
+runs as a compiled array kernel; otherwise as the list-based loop, which
+is the faster of the two under CPython. Both consume the Generator in
+the same order, so a seed gives the same map either way.
+"""
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _bridson_py(radius, bounds, k, rng):
+    cell = radius / math.sqrt(2)
+    size = 2 * bounds
+    n = int(math.ceil(size / cell))
+    grid = [-1] * (n * n)
+    r2 = radius * radius
+    xs, zs = [], []
+    active = []
+
+    def insert(x, z):
+        idx = len(xs)
+        xs.append(x)
+        zs.append(z)
+        grid[int((z + bounds) / cell) * n + int((x + bounds) / cell)] = idx
+        active.append(idx)
+
+    # Bind hot callables to locals: the loop below runs once per point
+    uniform, integers = rng.uniform, rng.integers
+    cos, sin, tau = np.cos, np.sin, math.tau
+
+    insert(*uniform(-bounds, bounds, 2).tolist())
+
+    while active:
+        a = int(integers(len(active)))
+        px, pz = xs[active[a]], zs[active[a]]
+
+        # k candidates in the annulus [r, 2r] around the active point
+        angles = uniform(0, tau, k)
+        dists = uniform(radius, 2 * radius, k)
+        cand_x = (px + cos(angles) * dists).tolist()
+        cand_z = (pz + sin(angles) * dists).tolist()
+
+        for x, z in zip(cand_x, cand_z):
+            if not (-bounds <= x < bounds and -bounds <= z < bounds):
+                continue
+            gx = int((x + bounds) / cell)
+            gz = int((z + bounds) / cell)
+            ok = True
+            for j in range(max(gz - 2, 0), min(gz + 3, n)):
+                row = j * n
+                for i in range(max(gx - 2, 0), min(gx + 3, n)):
+                    other = grid[row + i]
+                    if other >= 0:
+                        dx = xs[other] - x
+                        dz = zs[other] - z
+                        if dx*dx + dz*dz < r2:
+                            ok = False
+                            break
+                if not ok:
+                    break
+            if ok:
+                insert(x, z)
+                break
+        else:
+            # No candidate fit: this point is saturated
+            active[a] = active[-1]
+            active.pop()
+
+    return np.array(xs), np.array(zs)
+
+
+def _bridson_jit(radius, bounds, k, rng):
+    # Array form of _bridson_py for numba: preallocated buffers, scalar math
+    cell = radius / math.sqrt(2)
+    n = int(math.ceil(2 * bounds / cell))
+    r2 = radius * radius
+    tau = math.tau
+
+    # At most one point per grid cell, so n*n bounds every buffer
+    grid = np.full(n * n, -1, dtype=np.int64)
+    xs = np.empty(n * n)
+    zs = np.empty(n * n)
+    active = np.empty(n * n, dtype=np.int64)
+
+    x0 = rng.uniform(-bounds, bounds)
+    z0 = rng.uniform(-bounds, bounds)
+    xs[0] = x0
+    zs[0] = z0
+    grid[int((z0 + bounds) / cell) * n + int((x0 + bounds) / cell)] = 0
+    active[0] = 0
+    count = 1
+    n_active = 1
+
+    while n_active > 0:
+        a = rng.integers(0, n_active)
+        px = xs[active[a]]
+        pz = zs[active[a]]
+
+        # k candidates in the annulus [r, 2r] around the active point
+        angles = rng.uniform(0, tau, k)
+        dists = rng.uniform(radius, 2 * radius, k)
+        placed = False
+        for c in range(k):
+            x = px + math.cos(angles[c]) * dists[c]
+            z = pz + math.sin(angles[c]) * dists[c]
+            if not (-bounds <= x < bounds and -bounds <= z < bounds):
+                continue
+            gx = int((x + bounds) / cell)
+            gz = int((z + bounds) / cell)
+            ok = True
+            for j in range(max(gz - 2, 0), min(gz + 3, n)):
+                row = j * n
+                for i in range(max(gx - 2, 0), min(gx + 3, n)):
+                    other = grid[row + i]
+                    if other >= 0:
+                        dx = xs[other] - x
+                        dz = zs[other] - z
+                        if dx*dx + dz*dz < r2:
+                            ok = False
+                            break
+                if not ok:
+                    break
+            if ok:
+                xs[count] = x
+                zs[count] = z
+                grid[gz * n + gx] = count
+                active[n_active] = count
+                n_active += 1
+                count += 1
+                placed = True
+                break
+
+        if not placed:
+            # No candidate fit: this point is saturated
+            n_active -= 1
+            active[a] = active[n_active]
+
+    return xs[:count], zs[:count]
+
+
+if njit is not None:
+    _bridson = njit(cache=True)(_bridson_jit)
+else:
+    _bridson = _bridson_py
+
+
+def poisson_disc(radius, bounds, rng, k=30):
+    """Sample points in the square [-bounds, bounds]^2; returns (xs, zs) arrays."""
+    return _bridson(float(radius), float(bounds), k, rng)
+
+
+def poisson_annulus(radius, rmin, rmax, rng):
+    """Poisson-disc points with rmin <= dist < rmax, in random order.
+
+    Bridson grows outward from its seed, so shuffle before callers slice
+    off the first N points.
+    """
+    xs, zs = poisson_disc(radius, rmax, rng)
+    d2 = xs*xs + zs*zs
+    mask = (d2 >= rmin * rmin) & (d2 < rmax * rmax)
+    order = rng.permutation(int(mask.sum()))
+    return xs[mask][order], zs[mask][order]
@@ -1,56 +1,33 @@
-import json
-import random
+import argparse
 import math
 
+import numpy as np
+
+from _map_common import (
+    FILLER_TYPES,
+    MELODY_TYPES,
+    RHYTHM_TYPES,
+    SCATTER_TYPES,
+    cluster_items,
+    scatter_uniform_disc,
+    write_map_streaming,
+)
+from _poisson import poisson_annulus
+
 OUTPUT_FILE = "assets/map.json"
 MAP_RADIUS = 150
 GRASS_COUNT = 3000
+# Poisson-disc min distance between grass blades, derived from GRASS_COUNT:
+# a Bridson fill (k=30) leaves ~1.6 r^2 of disc per point, so sizing each
+# blade at 1.65 r^2 overfills slightly and the cut keeps exactly GRASS_COUNT
+GRASS_SPACING = math.sqrt(math.pi * MAP_RADIUS ** 2 / (1.65 * GRASS_COUNT))
+MAJOR_SPACING = 8.0  # ...and between scatter/filler objects
+SEED = None  # Set to an int for a reproducible map
 
-# Lists of types
-RHYTHM_TYPES = [
-    "kick_drum_geyser",
-    "snare_trap",
-    "cymbal_dandelion",
-    "subwoofer_lotus",
-    "accordion_palm"
-]
-
-MELODY_TYPES = [
-    "arpeggio_fern",
-    "vibrato_violet",
-    "tremolo_tulip",
-    "prism_rose_bush",
-    "portamento_pine"
-]
-
-SCATTER_TYPES = [
-    "bubble_willow",
-    "fiber_optic_willow",
-    "balloon_bush",
-    "helix_plant",
-    "wisteria_cluster",
-    "floating_orb",
-    "cloud"
-]
-
-FILLER_TYPES = [
-    "mushroom",
-    "flower",
-    "starflower"
-]
-
-def get_random_position(min_dist, max_dist):
-    angle = random.uniform(0, 2 * math.pi)
-    dist = random.uniform(min_dist, max_dist)
-    x = math.cos(angle) * dist
-    z = math.sin(angle) * dist
-    return x, z
-
-def generate_map():
-    items = []
-
-    print("Generating map...")
+# Each emit_* stage is a generator so items are written (and freed) as they
+# are produced instead of accumulating in one big list.
 
+def emit_fairy_ring():
     # --- 1. Fairy Ring (Hardcoded) ---
     # Center: (60, -40), Radius: 12, Count: 6 Giant Mushrooms
     print("Generating Fairy Ring...")
@@ -59,153 +36,141 @@ def generate_map():
     ring_radius = 12
     ring_count = 6
 
-    for i in range(ring_count):
-        angle = (i / ring_count) * 2 * math.pi
-        x = ring_center_x + math.cos(angle) * ring_radius
-        z = ring_center_z + math.sin(angle) * ring_radius
-
-        items.append({
+    angles = np.linspace(0, math.tau, ring_count, endpoint=False)
+    xs = ring_center_x + np.cos(angles) * ring_radius
+    zs = ring_center_z + np.sin(angles) * ring_radius
+    for x, z in zip(xs.tolist(), zs.tolist()):
+        yield {
             "type": "mushroom",
             "position": [x, 0, z],
             "scale": 1.5, # Base scale
             "variant": "giant",
             "hasFace": True
-        })
+        }
 
+def emit_clusters(rng):
     # --- 2. Clusters (Rhythm & Melody) ---
     # Aiming for ~80-100 items here
     num_clusters = 12
-    items_per_cluster_avg = 8
 
     print(f"Generating {num_clusters} clusters...")
 
-    for _ in range(num_clusters):
-        # Determine Cluster Type
-        is_rhythm = random.random() < 0.5
-        types_list = RHYTHM_TYPES if is_rhythm else MELODY_TYPES
-
-        # Cluster Center (Ensure away from 0,0)
-        cx, cz = get_random_position(30, MAP_RADIUS * 0.8) # Min dist 30 to be safe
+    # Cluster Centers (Ensure away from 0,0) - min dist 30 to be safe
+    cxs, czs = scatter_uniform_disc(num_clusters, 30, MAP_RADIUS * 0.8, rng)
+    is_rhythm = rng.random(num_clusters) < 0.5
+    counts = rng.integers(5, 12, num_clusters, endpoint=True)
 
-        count = random.randint(5, 12)
-
-        for _ in range(count):
-            type_name = random.choice(types_list)
-
-            # Scatter around cluster center
-            r = random.uniform(0, 8)
-            theta = random.uniform(0, 2 * math.pi)
-            x = cx + math.cos(theta) * r
-            z = cz + math.sin(theta) * r
-
-            # Check global safety (though 30 base + 8 radius > 20, let's be safe)
-            if x*x + z*z < 20*20:
-                continue
-
-            scale = random.uniform(0.8, 1.2)
-
-            # Specific tweaks
-            y = 0
-
-            items.append({
-                "type": type_name,
-                "position": [x, y, z],
-                "scale": scale
-            })
+    for cx, cz, rhythm, count in zip(cxs.tolist(), czs.tolist(), is_rhythm.tolist(), counts.tolist()):
+        # Determine Cluster Type
+        types_list = RHYTHM_TYPES if rhythm else MELODY_TYPES
 
+        yield from cluster_items((cx, cz), types_list, count, rng)
 
+def emit_scatter(xs, zs, rng):
     # --- 3. Global Scatter ---
     # ~50 items
     print("Generating Scatter items...")
-    for _ in range(50):
-        type_name = random.choice(SCATTER_TYPES)
-
-        valid = False
-        while not valid:
-            x, z = get_random_position(20, MAP_RADIUS)
-            if x*x + z*z >= 20*20:
-                valid = True
-
+    scales = rng.uniform(0.9, 1.5, len(xs))
+    type_names = rng.choice(SCATTER_TYPES, len(xs)).tolist()
+    for x, z, scale, type_name in zip(xs.tolist(), zs.tolist(), scales.tolist(), type_names):
         y = 0
-        scale = random.uniform(0.9, 1.5)
 
         if type_name == "cloud":
-            y = random.uniform(40, 70)
-            scale = random.uniform(1.5, 2.5) # Size param in JS
-            items.append({
+            y = rng.uniform(40, 70)
+            scale = rng.uniform(1.5, 2.5) # Size param in JS
+            yield {
                 "type": type_name,
                 "position": [x, y, z],
                 "size": scale # JS uses 'size' for cloud
-            })
+            }
         elif type_name == "floating_orb":
-             items.append({
+            yield {
                 "type": type_name,
                 "position": [x, 0, z], # JS adds height
                 "scale": scale
-            })
+            }
         else:
-            items.append({
+            yield {
                 "type": type_name,
                 "position": [x, y, z],
                 "scale": scale
-            })
+            }
 
+def emit_filler(xs, zs, rng):
     # --- 4. Filler ---
     # ~50 items
     print("Generating Filler items...")
-    for _ in range(50):
-        type_name = random.choice(FILLER_TYPES)
-
-        valid = False
-        while not valid:
-            x, z = get_random_position(20, MAP_RADIUS)
-            if x*x + z*z >= 20*20:
-                valid = True
-
+    # Points come from the [20, MAP_RADIUS] annulus, so every sample already
+    # clears the safe zone - no rejection loop needed.
+    scales = rng.uniform(0.7, 1.2, len(xs))
+    type_names = rng.choice(FILLER_TYPES, len(xs)).tolist()
+    variant_rolls = rng.random(len(xs)).tolist()
+    for x, z, scale, type_name, roll in zip(xs.tolist(), zs.tolist(), scales.tolist(), type_names, variant_rolls):
         item = {
             "type": type_name,
             "position": [x, 0, z],
-            "scale": random.uniform(0.7, 1.2)
+            "scale": scale
         }
 
         if type_name == "flower":
             # 20% chance for glowing flower
-            if random.random() < 0.2:
+            if roll < 0.2:
                 item["variant"] = "glowing"
         elif type_name == "mushroom":
             # Mostly regular, small chance of giant/face managed here or in JS?
             # User instructions said Filler: mushroom.
             # I'll default to regular, maybe 10% giant for variety.
-            item["variant"] = "regular" if random.random() > 0.1 else "giant"
-
-        items.append(item)
+            item["variant"] = "regular" if roll > 0.1 else "giant"
 
+        yield item
 
+def emit_grass(rng):
     # --- 5. Grass ---
     print(f"Generating {GRASS_COUNT} grass blades...")
-    for _ in range(GRASS_COUNT):
-        x, z = get_random_position(0, MAP_RADIUS)
-        # Grass can be anywhere? Or should it also respect safe zone?
-        # User said "Safe Zone: No *major* objects within 20 units".
-        # Usually grass is fine near start, makes it look grounded.
-        # But to be clean, I'll keep it out of the strict 5 unit circle maybe,
-        # but the request was specific to "major objects".
-        # I will let grass be everywhere.
-
-        items.append({
+    # Grass can be anywhere? Or should it also respect safe zone?
+    # User said "Safe Zone: No *major* objects within 20 units".
+    # Usually grass is fine near start, makes it look grounded.
+    # But to be clean, I'll keep it out of the strict 5 unit circle maybe,
+    # but the request was specific to "major objects".
+    # I will let grass be everywhere.
+    # Poisson-disc spacing gives even coverage; the fill comes out a few
+    # percent over GRASS_COUNT and is already shuffled, so trim the excess
+    xs, zs = poisson_annulus(GRASS_SPACING, 0, MAP_RADIUS, rng)
+    xs, zs = xs[:GRASS_COUNT], zs[:GRASS_COUNT]
+    scales = rng.uniform(0.7, 1.3, len(xs))
+    for x, z, s in zip(xs.tolist(), zs.tolist(), scales.tolist()):
+        yield {
             "type": "grass",
             "position": [x, 0, z],
-            "scale": random.uniform(0.7, 1.3)
-        })
+            "scale": s
+        }
 
-    # Summary
-    major_count = len([i for i in items if i["type"] != "grass"])
-    print(f"Total Major Objects: {major_count}")
-    print(f"Total Items: {len(items)}")
+def generate_map(seed=SEED, pretty=False):
+    # One PCG64 generator drives every stage; draws are batched per stage
+    rng = np.random.default_rng(seed)
+
+    print("Generating map...")
 
-    with open(OUTPUT_FILE, 'w') as f:
-        json.dump(items, f, indent=2)
+    # Scatter + Filler share one blue-noise point set so they never overlap
+    major_xs, major_zs = poisson_annulus(MAJOR_SPACING, 20, MAP_RADIUS, rng)
+
+    type_counts = write_map_streaming(OUTPUT_FILE, [
+        emit_fairy_ring(),
+        emit_clusters(rng),
+        emit_scatter(major_xs[:50], major_zs[:50], rng),
+        emit_filler(major_xs[50:100], major_zs[50:100], rng),
+        emit_grass(rng),
+    ], pretty=pretty)
+
+    # Summary
+    total = sum(type_counts.values())
+    print(f"Total Major Objects: {total - type_counts['grass']}")
+    print(f"Total Items: {total}")
     print(f"Saved to {OUTPUT_FILE}")
 
 if __name__ == "__main__":
-    generate_map()
+    parser = argparse.ArgumentParser(description="Generate assets/map.json")
+    parser.add_argument("--pretty", action="store_true",
+                        help="indent the JSON for debugging (default: compact)")
+    args = parser.parse_args()
+    generate_map(pretty=args.pretty)
@@ -1,38 +1,43 @@
-import os
 import re
 
 target_file = 'public/js/libopenmpt.js'
 
+# Patch 1: The specific Memory polyfill pattern causing the BigInt crash
+BAD_MEMORY_POLYFILL = b"this.buffer = new ArrayBuffer(opts['initial'] * 65536);"
+# The fix: cast to Number()
+FIXED_MEMORY_POLYFILL = b"this.buffer = new ArrayBuffer(Number(opts['initial']) * 65536);"
+
+# Patch 2: The asmFunc has a hardcoded 537MB buffer (537460736 bytes) which causes
+# "Array buffer allocation failed" in AudioWorklet contexts
+# We reduce it to 64MB which should be sufficient for most use cases
+LARGE_BUFFER_RE = re.compile(rb"(function asmFunc\(imports\) \{\s*)var buffer = new ArrayBuffer\(537460736\);")
+REDUCED_BUFFER = rb"\1var buffer = new ArrayBuffer(67108864);"  # 64MB instead of 537MB
+
 def patch_file(filepath):
-    with open(filepath, 'r', encoding='utf-8') as f:
+    # Work on raw bytes: the file is a multi-MB generated asset and the
+    # patterns are plain ASCII, so there is no need to decode it.
+    with open(filepath, 'rb') as f:
         content = f.read()
     
     patches_applied = []
     
     # Patch 1: Fix BigInt/Number mixing error in Memory polyfill
-    # The specific polyfill pattern causing the crash
-    bad_pattern = "this.buffer = new ArrayBuffer(opts['initial'] * 65536);"
-    # The fix: cast to Number()
-    good_pattern = "this.buffer = new ArrayBuffer(Number(opts['initial']) * 65536);"
-    
-    if bad_pattern in content:
-        content = content.replace(bad_pattern, good_pattern)
+    # replace() is a no-op when the pattern is absent, so call it once instead
+    # of scanning with `in` first. The fix is longer than the original, so a
+    # length change (O(1)) tells us whether it matched.
+    patched = content.replace(BAD_MEMORY_POLYFILL, FIXED_MEMORY_POLYFILL, 1)
+    if len(patched) != len(content):
+        content = patched
         patches_applied.append("Fixed BigInt/Number mixing in Memory polyfill")
     
     # Patch 2: Reduce large asmFunc buffer for AudioWorklet compatibility
-    # The asmFunc has a hardcoded 537MB buffer (537460736 bytes) which causes
-    # "Array buffer allocation failed" in AudioWorklet contexts
-    # We reduce it to 64MB which should be sufficient for most use cases
-    large_buffer_pattern = r"(function asmFunc\(imports\) \{\s*)var buffer = new ArrayBuffer\(537460736\);"
-    reduced_buffer = r"\1var buffer = new ArrayBuffer(67108864);"  # 64MB instead of 537MB
-    
-    if re.search(large_buffer_pattern, content):
-        content = re.sub(large_buffer_pattern, reduced_buffer, content)
+    content, count = LARGE_BUFFER_RE.subn(REDUCED_BUFFER, content, count=1)
+    if count:
         patches_applied.append("Reduced asmFunc buffer from 537MB to 64MB for AudioWorklet compatibility")
     
     # Write back if changes were made
     if patches_applied:
-        with open(filepath, 'w', encoding='utf-8') as f:
+        with open(filepath, 'wb', buffering=1 << 20) as f:
             f.write(content)
         return patches_applied
     else:
@@ -0,0 +1,58 @@
+"""Seeded checks for the map.json writer: python -m pytest tools/"""
+import json
+import math
+
+import numpy as np
+import pytest
+
+import _map_common
+import generate_map
+
+
+def write_seeded_map(tmp_path, monkeypatch, name, pretty=False):
+    path = tmp_path / name
+    monkeypatch.setattr(generate_map, "OUTPUT_FILE", str(path))
+    generate_map.generate_map(seed=1, pretty=pretty)
+    return path.read_bytes()
+
+
+def test_orjson_and_stdlib_write_the_same_bytes(tmp_path, monkeypatch):
+    pytest.importorskip("orjson")
+    fast = write_seeded_map(tmp_path, monkeypatch, "orjson.json")
+    monkeypatch.setattr(_map_common, "orjson", None)
+    stdlib = write_seeded_map(tmp_path, monkeypatch, "stdlib.json")
+    assert fast == stdlib
+    items = json.loads(stdlib)
+    assert sum(item["type"] == "grass" for item in items) == generate_map.GRASS_COUNT
+
+
+@pytest.mark.parametrize("backend", ["orjson", "stdlib"])
+def test_pretty_holds_the_same_items_as_compact(tmp_path, monkeypatch, backend):
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(_map_common, "orjson", None)
+    compact = write_seeded_map(tmp_path, monkeypatch, "compact.json")
+    pretty = write_seeded_map(tmp_path, monkeypatch, "pretty.json", pretty=True)
+    assert b"\n" not in compact and b", " not in compact and b": " not in compact
+    assert len(compact) < len(pretty)
+    assert json.loads(compact) == json.loads(pretty)
+
+
+def test_cluster_items_respect_safe_radius():
+    # A cluster straddling the safe-zone edge: the mask must drop the
+    # inner items and keep the rest
+    count = 500
+    items = _map_common.cluster_items((15, 0), _map_common.RHYTHM_TYPES, count, np.random.default_rng(3))
+    assert 0 < len(items) < count
+    for item in items:
+        x, _, z = item["position"]
+        assert math.hypot(x, z) >= _map_common.SAFE_RADIUS
+
+
+def test_no_major_object_in_safe_zone(tmp_path, monkeypatch):
+    items = json.loads(write_seeded_map(tmp_path, monkeypatch, "map.json"))
+    for item in items:
+        if item["type"] != "grass":
+            x, _, z = item["position"]
+            assert math.hypot(x, z) >= _map_common.SAFE_RADIUS, item
@@ -0,0 +1,39 @@
+"""Seeded checks for the Poisson-disc sampler: python -m pytest tools/"""
+import numpy as np
+
+from _poisson import poisson_annulus, poisson_disc
+from generate_map import GRASS_COUNT, GRASS_SPACING, MAP_RADIUS
+
+
+def min_distance(xs, zs):
+    pts = np.stack([xs, zs], axis=1)
+    d2 = ((pts[:, None, :] - pts[None, :, :]) ** 2).sum(axis=-1)
+    np.fill_diagonal(d2, np.inf)
+    return np.sqrt(d2.min())
+
+
+def test_disc_spacing_and_bounds():
+    xs, zs = poisson_disc(5.0, 50, np.random.default_rng(1))
+    assert len(xs) > 100
+    assert min_distance(xs, zs) >= 5.0
+    assert np.all(np.abs(xs) <= 50) and np.all(np.abs(zs) <= 50)
+
+
+def test_annulus_bounds():
+    xs, zs = poisson_annulus(4.0, 20, 60, np.random.default_rng(2))
+    d = np.hypot(xs, zs)
+    assert np.all(d >= 20) and np.all(d < 60)
+    assert min_distance(xs, zs) >= 4.0
+
+
+def test_same_seed_same_points():
+    a = poisson_annulus(4.0, 0, 60, np.random.default_rng(7))
+    b = poisson_annulus(4.0, 0, 60, np.random.default_rng(7))
+    np.testing.assert_array_equal(a[0], b[0])
+    np.testing.assert_array_equal(a[1], b[1])
+
+
+def test_grass_spacing_fills_grass_count():
+    for seed in range(5):
+        xs, _ = poisson_annulus(GRASS_SPACING, 0, MAP_RADIUS, np.random.default_rng(seed))
+        assert len(xs) >= GRASS_COUNT
@@ -0,0 +1,248 @@
+"""Shared helpers for the Playwright verifiers."""
+import io
+import os
+import subprocess
+import time
+import urllib.request
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlsplit
+
+try:
+    import imagehash
+    from PIL import Image
+except ImportError:  # no perceptual gating: every screenshot is written
+    imagehash = None
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PREVIEW_PORT = 4173  # `vite preview` default; verifiers load the built app
+PREVIEW_URL = f"http://localhost:{PREVIEW_PORT}/"
+LOCAL_HOSTS = frozenset({"localhost", "127.0.0.1"})
+
+# Persistent Chromium profile + HTTP cache, kept across runs (gitignored)
+CACHE_DIR = os.path.join(REPO_ROOT, ".cache")
+
+# Chromium flags for every verifier browser, on top of Playwright's defaults
+# (which already disable background throttling, backgrounding and IPC flood
+# protection, and pass --no-sandbox/--mute-audio/--enable-unsafe-swiftshader
+# headless). The scene needs WebGL (SwiftShader through ANGLE, as
+# tests/smoke-runner.mjs uses) and WebGPU; the rest is a shared disk cache
+# and no zygote forks. Don't pass --disable-features here - Chromium keeps
+# only the last copy of a switch, which would drop Playwright's list.
+LAUNCH_ARGS = [
+    "--use-gl=angle",
+    "--use-angle=swiftshader",
+    "--enable-unsafe-webgpu",
+    f"--disk-cache-dir={os.path.join(CACHE_DIR, 'pw-disk')}",
+    "--no-zygote",
+]
+
+# Perceptual hashes of accepted screenshots, one .phash per screenshot path.
+# Committed, so CI compares against them; recorded or replaced only when
+# asked, via `pytest --update-baselines` or VERIFY_UPDATE_BASELINES=1.
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+# save_screenshot() resolves relative paths here (gitignored)
+SCREENSHOT_DIR = Path(__file__).resolve().parent / "screenshots"
+PHASH_TOLERANCE = 5  # Hamming distance still treated as "unchanged"
+UPDATE_BASELINES = os.getenv("VERIFY_UPDATE_BASELINES") == "1"
+
+# Screenshots are opt-in under pytest: VERIFY_SCREENSHOT=1 writes every
+# shot, =fail keeps them in memory and writes them only if the test fails.
+# By default runs skip the capture + encode entirely; pass --tracing
+# (conftest.py) for a trace instead. Standalone `python verify_*.py` runs
+# default to 1.
+SCREENSHOT_MODE = os.getenv("VERIFY_SCREENSHOT", "0")
+_deferred = []  # (path, bytes) captured in "fail" mode for the current test
+
+# Screenshot files are written off the driver thread; wait_for_writes()
+# joins them so a failed write fails the test instead of vanishing
+_io = ThreadPoolExecutor(2)
+_pending = []  # write Futures not yet checked
+
+
+def user_data_dir(name):
+    """Per-process Chromium profile dir; a profile can only be open once."""
+    return os.path.join(CACHE_DIR, "pw", name)
+
+
+def http_ok(url):
+    try:
+        with urllib.request.urlopen(url, timeout=2) as resp:
+            return resp.status == 200
+    except OSError:
+        return False
+
+
+def start_preview_server(port=PREVIEW_PORT, timeout=60):
+    """Start `vite preview` (serving dist/) on port and wait until it serves.
+
+    Waits until the page itself answers 200 - an open port alone can still
+    be a server that is booting - so the first verifier navigation is warm.
+    Returns the Popen to terminate afterwards. Build first with
+    `npm run build:ci`.
+    """
+    url = f"http://localhost:{port}/"
+    proc = subprocess.Popen(
+        ["npx", "vite", "preview", "--port", str(port), "--strictPort"],
+        cwd=REPO_ROOT,
+        stdout=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + timeout
+    while not http_ok(url):
+        if proc.poll() is not None:
+            raise RuntimeError(f"vite preview exited with {proc.returncode}")
+        if time.monotonic() > deadline:
+            proc.terminate()
+            raise RuntimeError(f"{url} did not answer 200 after {timeout}s")
+        time.sleep(0.2)
+    return proc
+
+
+def goto_with_retry(page, url, attempts=10, **goto_kwargs):
+    """page.goto() that retries while a standalone run's server is booting.
+
+    Only connection-refused navigations are retried - they fail at once, so
+    ten attempts with exponential backoff (capped at 5s) cover a cold vite
+    start. Timeouts and every other error, and KeyboardInterrupt, propagate
+    immediately: a hung page fails after one navigation timeout. Under
+    pytest, preview_url has already waited for the server.
+    """
+    # Imported here so conftest.py (and the static checks) load without
+    # Playwright installed
+    from playwright.sync_api import Error as PlaywrightError
+
+    for attempt in range(attempts):
+        try:
+            return page.goto(url, **goto_kwargs)
+        except PlaywrightError as exc:
+            if "ERR_CONNECTION_REFUSED" not in exc.message or attempt == attempts - 1:
+                raise
+            time.sleep(min(0.5 * 2 ** attempt, 5))
+
+
+def block_assets(page, kinds=("image", "font", "media"), third_party=True):
+    """Abort requests of the given resource types for DOM/UI-only checks.
+
+    third_party also aborts anything not served by the local preview
+    server - e.g. the render-blocking Google Fonts stylesheet, which
+    loads as a "stylesheet" and so slips past the font filter.
+
+    Don't use it on verifiers that screenshot the 3D scene: textures load
+    as "image" requests.
+    """
+    blocked = frozenset(kinds)
+
+    def handle(route):
+        request = route.request
+        if request.resource_type in blocked or (
+            third_party and urlsplit(request.url).hostname not in LOCAL_HOSTS
+        ):
+            route.abort()
+        else:
+            route.continue_()
+
+    page.route("**/*", handle)
+
+
+def tail_console(page, maxlen=20):
+    """Keep only the last maxlen console messages, for failure messages.
+
+    The scene logs every frame in places, so an unbounded list just grows.
+    To wait for a particular message use page.expect_console_message() -
+    sync-API callbacks only run while Playwright is pumping, so a
+    threading.Event set from here would never fire during a plain wait.
+    """
+    logs = deque(maxlen=maxlen)
+    page.on("console", lambda msg: logs.append(f"[{msg.type}] {msg.text}"))
+    return logs
+
+
+def paint(page):
+    """Return once the next frame has painted (double rAF), e.g. after a
+    focus change, instead of a fixed wait_for_timeout()."""
+    page.evaluate("() => new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r)))")
+
+
+def wait_for_scene(page, timeout=30000):
+    """Wait for the app's readiness flag instead of sleeping:
+    window.__sceneReady is set once the render loop starts."""
+    page.wait_for_function("() => window.__sceneReady === true", timeout=timeout)
+
+
+def baseline_path(path):
+    """Baseline file for a screenshot path, keyed by the whole repo-relative
+    path so same-named shots in different dirs don't share one."""
+    key = path.resolve().relative_to(Path(REPO_ROOT).resolve())
+    return BASELINE_DIR / f"{'__'.join(key.parts)}.phash"
+
+
+def _write(path, data, gate=True):
+    if gate and imagehash is not None:
+        digest = imagehash.phash(Image.open(io.BytesIO(data)))
+        baseline = baseline_path(path)
+        if UPDATE_BASELINES:
+            BASELINE_DIR.mkdir(parents=True, exist_ok=True)
+            baseline.write_text(f"{digest}\n")
+        elif baseline.exists():
+            if digest - imagehash.hex_to_hash(baseline.read_text().strip()) <= PHASH_TOLERANCE:
+                return False  # looks like the baseline: nothing to persist
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return True
+
+
+def save_screenshot(target, path, quality=70, **screenshot_kwargs):
+    """Capture to memory and write the file on a background thread.
+
+    target is a Page or, preferably, the Locator/ElementHandle under test -
+    far fewer pixels to rasterize and encode than the full viewport. path
+    is relative to verification/screenshots/.
+
+    A .jpg/.jpeg path is encoded as JPEG (much smaller; fine for DOM/focus
+    shots); keep .png where pixel-exact visual regression matters.
+
+    With imagehash installed, a shot within PHASH_TOLERANCE of its
+    committed baseline is not written, so green runs write (and upload)
+    nothing; shots without a baseline are always written. UPDATE_BASELINES
+    re-records the baseline and writes the shot. Returns a Future
+    resolving to whether the file was written - always False unless
+    VERIFY_SCREENSHOT=1.
+    """
+    skipped = Future()
+    skipped.set_result(False)
+    if SCREENSHOT_MODE not in ("1", "fail"):
+        return skipped
+    path = SCREENSHOT_DIR / path
+    # Freeze CSS animations at their end state so no settle wait is needed
+    screenshot_kwargs.setdefault("animations", "disabled")
+    screenshot_kwargs.setdefault("caret", "hide")
+    if path.suffix.lower() in (".jpg", ".jpeg"):
+        screenshot_kwargs.update(type="jpeg", quality=quality)
+    data = target.screenshot(**screenshot_kwargs)
+    if SCREENSHOT_MODE == "fail":
+        _deferred.append((path, data))
+        return skipped
+    future = _io.submit(_write, path, data)
+    _pending.append(future)
+    return future
+
+
+def wait_for_writes():
+    """Block until every submitted screenshot write finishes, re-raising
+    the first write error (full disk, bad path, ...)."""
+    pending = _pending[:]
+    _pending.clear()
+    for future in pending:
+        future.result()
+
+
+def flush_deferred(failed):
+    """End-of-test hook: with VERIFY_SCREENSHOT=fail write the test's
+    buffered shots (ungated by baselines) if it failed, else drop them;
+    then wait for the test's writes to land."""
+    if failed:
+        for path, data in _deferred:
+            _pending.append(_io.submit(_write, path, data, gate=False))
+    _deferred.clear()
+    wait_for_writes()
@@ -0,0 +1,182 @@
+"""pytest configuration for the Playwright verifiers.
+
+Each pytest(-xdist) worker launches Chromium once and hands every test a
+fresh page, so a worker pays for a single launch no matter how many
+verifiers it runs:
+
+    pip install -r verification/requirements.txt   # + requirements-optional.txt
+    npm run build:ci               # verifiers run against the built app
+    pytest verification/
+    pytest -n auto --dist=loadfile verification/   # parallel, with pytest-xdist
+    VERIFY_SCREENSHOT=1 pytest verification/      # also save screenshots/
+    VERIFY_SCREENSHOT=fail pytest verification/   # ...only for failed tests
+    pytest verification/ --tracing=retain-on-failure  # traces/trace-*.zip
+    VERIFY_SCREENSHOT=1 pytest verification/ --update-baselines  # commit baselines/
+
+Browser verifiers take the `preview_url` fixture: one `vite preview` on
+:4173 serves every worker - reused if already running, otherwise started
+by the first worker that needs it and stopped after the last. Checks that
+need no browser (e.g. verify_static.py) never start a server.
+
+Contexts are persistent (one user-data-dir per worker under .cache/pw) so
+Chromium's shader, code and HTTP caches survive between runs: warm reruns
+skip SwiftShader/WebGPU shader recompiles and re-downloading vite assets.
+The app's own site data (localStorage, IndexedDB, ...) is cleared before
+every test.
+"""
+import json
+import os
+import re
+import signal
+from urllib.parse import urlsplit
+
+import pytest
+
+import _harness
+from _harness import (
+    LAUNCH_ARGS,
+    PREVIEW_URL,
+    flush_deferred,
+    http_ok,
+    start_preview_server,
+    user_data_dir,
+)
+
+# --tracing output: open with `playwright show-trace <zip>`
+TRACE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "traces")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--update-baselines", action="store_true",
+        help="record each screenshot's perceptual hash as its new baseline",
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("update_baselines"):
+        _harness.UPDATE_BASELINES = True
+
+
+def _server_users(state, delta):
+    """Add delta to the shared server's user count; returns the record."""
+    server = json.loads(state.read_text())
+    server["users"] += delta
+    state.write_text(json.dumps(server))
+    return server
+
+
+@pytest.fixture(scope="session")
+def preview_url(tmp_path_factory):
+    # One `vite preview` for the whole run, shared by every xdist worker.
+    # Workers register in a state file in the run's shared basetemp (behind
+    # a FileLock): the first to need the server starts it, the last one out
+    # stops it, so no worker kills a server another is still using.
+    from filelock import FileLock  # browser-only dependency
+
+    basetemp = tmp_path_factory.getbasetemp()
+    root = basetemp.parent if "PYTEST_XDIST_WORKER" in os.environ else basetemp
+    state = root / "preview.json"
+    lock = FileLock(str(root / "preview.lock"))
+    proc = None
+    with lock:
+        if not state.exists():
+            if not http_ok(PREVIEW_URL):
+                proc = start_preview_server()
+            # pid None: someone else's server - reuse it, never stop it
+            state.write_text(json.dumps({"pid": proc.pid if proc else None, "users": 0}))
+        _server_users(state, +1)
+    try:
+        yield PREVIEW_URL
+    finally:
+        with lock:
+            server = _server_users(state, -1)
+            if not server["users"]:
+                state.unlink()
+                if proc is not None:
+                    proc.terminate()
+                    proc.wait(timeout=10)
+                elif server["pid"] is not None:
+                    os.kill(server["pid"], signal.SIGTERM)
+
+
+@pytest.fixture(scope="session")
+def browser_context_args(browser_context_args):
+    return {
+        **browser_context_args,
+        "viewport": {"width": 1280, "height": 720},
+        "ignore_https_errors": True,
+        # The app honours prefers-reduced-motion (loading screen, HUD,
+        # accessibility prefs), so opening transitions are skipped
+        "reduced_motion": "reduce",
+    }
+
+
+@pytest.fixture(scope="session")
+def persistent_context(browser_type, browser_type_launch_args, browser_context_args):
+    # One profile per xdist worker; a profile can only be open once
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    context = browser_type.launch_persistent_context(
+        user_data_dir(worker),
+        **{**browser_type_launch_args, "args": LAUNCH_ARGS},
+        **browser_context_args,
+    )
+    yield context
+    context.close()
+
+
+# Everything the app persists per origin: world seed, renderer mode,
+# accessibility prefs (localStorage) and save-system data (IndexedDB)
+_SITE_STORAGE = "cookies,local_storage,indexeddb,websql,service_workers,cache_storage,file_systems"
+
+
+def clear_site_data(context, url):
+    """Wipe the app's storage for url's origin in a persistent profile.
+
+    The HTTP, code and shader caches are not site storage, so they (the
+    point of the persistent profile) survive.
+    """
+    parts = urlsplit(url)
+    page = context.pages[0] if context.pages else context.new_page()
+    cdp = context.new_cdp_session(page)
+    try:
+        cdp.send("Storage.clearDataForOrigin", {
+            "origin": f"{parts.scheme}://{parts.netloc}",
+            "storageTypes": _SITE_STORAGE,
+        })
+    finally:
+        cdp.detach()
+
+
+@pytest.fixture
+def context(persistent_context, preview_url, pytestconfig, request):
+    # Replaces pytest-playwright's fresh-context-per-test: pages are per
+    # test and the app's site data is wiped before each one (also clearing
+    # state left by a previous run), so verifiers stay independent.
+    # Honours --tracing (off/on/retain-on-failure); --video and
+    # --screenshot don't apply to these contexts (see pytest.ini).
+    clear_site_data(persistent_context, preview_url)
+    tracing = pytestconfig.getoption("tracing")
+    if tracing != "off":
+        persistent_context.tracing.start(screenshots=True, snapshots=True)
+    yield persistent_context
+    # pytest-playwright sets item.rep_setup / rep_call / rep_teardown
+    rep = getattr(request.node, "rep_call", None)
+    failed = rep is not None and rep.failed
+    if tracing == "on" or (tracing == "retain-on-failure" and failed):
+        os.makedirs(TRACE_DIR, exist_ok=True)
+        name = re.sub(r"[^\w.-]+", "_", request.node.name)
+        persistent_context.tracing.stop(path=os.path.join(TRACE_DIR, f"trace-{name}.zip"))
+    elif tracing != "off":
+        persistent_context.tracing.stop()
+    for page in persistent_context.pages[1:]:
+        page.close()
+    # Last: raises if one of the test's screenshot writes failed
+    flush_deferred(failed)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config):
+    # `-n auto`: one Chromium per worker; past ~6 concurrent SwiftShader
+    # pages the CPU saturates and verifiers only get slower.
+    return min(6, os.cpu_count() or 1)
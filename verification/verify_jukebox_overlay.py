@@ -0,0 +1,106 @@
+import os
+
+from playwright.sync_api import sync_playwright
+
+import _harness
+from _harness import (
+    LAUNCH_ARGS,
+    PREVIEW_URL,
+    block_assets,
+    goto_with_retry,
+    paint,
+    save_screenshot,
+    tail_console,
+    user_data_dir,
+    wait_for_scene,
+    wait_for_writes,
+)
+
+def test_jukebox_overlay(page, preview_url):
+    # UI-only check: skip web fonts, media and off-origin requests (Google
+    # Fonts CSS). Images stay on because the scene still has to boot
+    # (textures) before the pause menu is reachable.
+    block_assets(page, kinds=("font", "media"))
+    logs = tail_console(page)
+
+    # Navigate to the page. Return as soon as the response commits; the
+    # start button below is the real barrier
+    goto_with_retry(page, f"{preview_url}?FULL_BOOT=fast", wait_until="commit")
+
+    # Wait for the Start button to become enabled (assets loaded)
+    page.wait_for_function(
+        "() => { const b = document.getElementById('startButton'); return b && !b.disabled; }",
+        timeout=60000,
+    )
+
+    # Click the Start button and wait for the scene to report ready
+    page.evaluate("document.getElementById('startButton').click()")
+    wait_for_scene(page)
+
+    # Press Esc to open the pause menu and show buttons
+    page.keyboard.press("Escape")
+    page.wait_for_selector("#instructions", state="visible")
+
+    # Open the Jukebox using Q or clicking the button
+    page.keyboard.press("Q")
+    page.wait_for_selector("#playlist-overlay .jukebox-empty-state", state="visible")
+    # Resolve the overlay once; every later read goes through this handle
+    overlay = page.query_selector("#playlist-overlay")
+
+    # Read everything we assert on in one round-trip instead of a locator call each
+    state = overlay.evaluate("""overlay => {
+        return {
+            overlayDisplay: getComputedStyle(overlay).display,
+            emptyState: !!overlay.querySelector('.jukebox-empty-state'),
+            browseBtn: !!overlay.querySelector('.jukebox-browse-btn'),
+            // innerText only covers rendered text, so this also checks visibility
+            navHint: overlay.innerText.includes('Navigate:'),
+            expanded: document.getElementById('openJukeboxBtn').getAttribute('aria-expanded'),
+        };
+    }""")
+    assert state["overlayDisplay"] == "flex", (state, list(logs))
+    assert state["emptyState"] and state["browseBtn"], (state, list(logs))
+    assert state["expanded"] == "true", (state, list(logs))
+    assert state["navHint"], (state, list(logs))
+
+    # We expect the empty state to be visible. Let's take a screenshot.
+    save_screenshot(overlay, "jukebox_overlay.jpg")
+
+    # The overlay traps focus after yielding to paint; wait for focus to land
+    # inside it instead of sleeping
+    page.wait_for_function("overlay => overlay.contains(document.activeElement)", arg=overlay)
+
+    # Press Tab. The focus should move to the "Close" button first, then "Browse Music" button
+    page.keyboard.press("Tab")
+    page.keyboard.press("Tab")
+    paint(page)  # let the focus ring render before reading/shooting it
+    focus = overlay.evaluate("""overlay => {
+        const el = document.activeElement;
+        return {
+            inOverlay: overlay.contains(el),
+            label: el.getAttribute('aria-label') || el.innerText,
+        };
+    }""")
+    assert focus["inOverlay"], f"focus escaped the Jukebox: {focus}"
+
+    # Take a screenshot to verify focus
+    save_screenshot(overlay, "jukebox_overlay_focus.jpg")
+
+if __name__ == "__main__":
+    # Run by hand, the screenshots are the point: save them unless told not to
+    _harness.SCREENSHOT_MODE = os.getenv("VERIFY_SCREENSHOT", "1")
+    with sync_playwright() as p:
+        context = p.chromium.launch_persistent_context(
+            user_data_dir("main"),
+            headless=True,
+            args=LAUNCH_ARGS,
+            viewport={"width": 1280, "height": 720},
+            reduced_motion="reduce",
+            record_video_dir=os.path.join(os.path.dirname(os.path.abspath(__file__)), "videos"),
+        )
+        page = context.new_page()
+        try:
+            test_jukebox_overlay(page, PREVIEW_URL)
+        finally:
+            context.close()
+    wait_for_writes()
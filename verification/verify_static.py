@@ -0,0 +1,55 @@
+"""Markup/CSS checks on index.html that need no JS - and so no browser.
+
+A parse takes ~20ms versus ~1s to launch Chromium and boot the app, so
+anything answerable from the static HTML and its <style> block lives here.
+It needs only the first block of verification/requirements.txt - no
+Playwright, build or server:
+
+    pytest verification/verify_static.py
+"""
+import os
+
+import lxml.html
+import tinycss2
+
+INDEX_HTML = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "index.html")
+
+_doc = None
+
+
+def doc():
+    global _doc
+    if _doc is None:
+        _doc = lxml.html.parse(INDEX_HTML)
+    return _doc
+
+
+def css_rule(selector):
+    """Declarations of the first inline <style> rule whose prelude is selector."""
+    for style in doc().xpath("//style"):
+        for rule in tinycss2.parse_stylesheet(style.text, skip_comments=True, skip_whitespace=True):
+            if rule.type != "qualified-rule" or tinycss2.serialize(rule.prelude).strip() != selector:
+                continue
+            return {
+                decl.lower_name: tinycss2.serialize(decl.value).strip()
+                for decl in tinycss2.parse_declaration_list(rule.content, skip_comments=True, skip_whitespace=True)
+                if decl.type == "declaration"
+            }
+    raise AssertionError(f"no CSS rule for {selector!r} in index.html")
+
+
+def test_kbd_keys_styled():
+    assert doc().xpath("//kbd[contains(concat(' ', @class, ' '), ' key ')]")
+    rule = css_rule("kbd.key")
+    assert rule["display"] == "inline-block", rule
+    assert "monospace" in rule["font-family"], rule
+
+
+def test_controls_lists():
+    assert len(doc().xpath("//dl[contains(concat(' ', @class, ' '), ' controls-list ')]")) >= 4
+
+
+def test_mute_button_labelled():
+    (btn,) = doc().xpath("//*[@id='toggleMuteBtn']")
+    assert btn.get("aria-keyshortcuts") == "M"
+    assert "Mute" in btn.text_content()